@@ -8,20 +8,63 @@ using PyInstaller. It packages all necessary files and creates a distribution
 package for easy deployment.
 
 Usage:
-    python3 build.py
+    python3 build.py [--pack {onedir,onefile}]
+
+    --pack onedir   (default) Ship the executable next to its unpacked
+                    dependencies. Starts fast because nothing has to be
+                    extracted at launch.
+    --pack onefile  Ship a single self-extracting executable. Every launch
+                    unpacks the bundle to a temp directory first, which adds
+                    a noticeable delay to server startup.
 
 Requirements:
     - Python 3.6+
     - PyInstaller (will be installed automatically if missing)
 """
 
+import argparse
+import concurrent.futures
 import os
 import sys
 import shutil
 import subprocess
+import zipfile
 from pathlib import Path
 
+# Text files worth compressing; everything else (the executable and the
+# libraries PyInstaller already compressed) is stored as-is
+COMPRESSIBLE_SUFFIXES = {".html", ".js", ".css", ".json", ".md", ".txt", ".bat", ".sh", ".csv"}
+
+def create_zip(source_dir, zip_path):
+    """Zip the contents of source_dir, deflating only text files"""
+    with zipfile.ZipFile(zip_path, 'w') as zf:
+        for root, _, files in os.walk(source_dir):
+            for file_name in files:
+                path = Path(root) / file_name
+                arcname = path.relative_to(source_dir)
+                if path.suffix.lower() in COMPRESSIBLE_SUFFIXES:
+                    zf.write(path, arcname, compress_type=zipfile.ZIP_DEFLATED, compresslevel=1)
+                else:
+                    zf.write(path, arcname, compress_type=zipfile.ZIP_STORED)
+
+def copy_files(copy_jobs):
+    """Copy (source, destination) file pairs on a small thread pool"""
+    for _, dst in copy_jobs:
+        dst.parent.mkdir(parents=True, exist_ok=True)
+    with concurrent.futures.ThreadPoolExecutor(max_workers=min(8, os.cpu_count() or 1)) as executor:
+        # list() re-raises the first copy error, if any
+        list(executor.map(lambda job: shutil.copy2(*job), copy_jobs))
+
 def main():
+    parser = argparse.ArgumentParser(description="Build the Fedshi Integration Tool executable")
+    parser.add_argument(
+        "--pack",
+        choices=["onedir", "onefile"],
+        default="onedir",
+        help="PyInstaller bundle layout (default: onedir, for fast startup)",
+    )
+    args = parser.parse_args()
+    
     print("=" * 60)
     print("🔨 Fedshi Integration Tool - Build Script")
     print("=" * 60)
@@ -48,12 +91,15 @@ def main():
             print(f"❌ Failed to install PyInstaller: {e}")
             sys.exit(1)
     
-    # Build executable
-    print("🔨 Building executable...")
+    # Build executable; PyInstaller byte-compiles the modules it bundles
+    print(f"🔨 Building executable ({args.pack})...")
+    pyinstaller_args = ["pyinstaller", f"--{args.pack}", "--console", "--noupx"]
+    if os.name != 'nt':
+        # Strip debug symbols from bundled shared libraries
+        pyinstaller_args.append("--strip")
+    pyinstaller_args.append("server.py")
     try:
-        subprocess.check_call([
-            "pyinstaller", "--onefile", "--console", "server.py"
-        ])
+        subprocess.check_call(pyinstaller_args)
         print("✅ Executable built successfully!")
     except subprocess.CalledProcessError as e:
         print(f"❌ Build failed: {e}")
@@ -69,27 +115,48 @@ def main():
     package_dir.mkdir(exist_ok=True)
     
     # Copy executable
-    exe_path = dist_dir / "server"
-    if exe_path.exists():
-        if os.name == 'nt':  # Windows
-            shutil.copy2(exe_path, package_dir / "FedshiIntegrationTool.exe")
-        else:  # Linux/Mac
-            shutil.copy2(exe_path, package_dir / "FedshiIntegrationTool")
-        print("✅ Copied executable to package")
+    exe_suffix = ".exe" if os.name == 'nt' else ""
+    if args.pack == "onedir":
+        # The executable needs its _internal/ directory next to it
+        onedir_path = dist_dir / "server"
+        exe_path = onedir_path / f"server{exe_suffix}"
+        if exe_path.exists():
+            shutil.copytree(onedir_path, package_dir, dirs_exist_ok=True)
+            os.replace(package_dir / f"server{exe_suffix}", package_dir / f"FedshiIntegrationTool{exe_suffix}")
+            print("✅ Copied executable and dependencies to package")
+        else:
+            print("❌ Executable not found after build")
+            sys.exit(1)
     else:
-        print("❌ Executable not found after build")
-        sys.exit(1)
+        exe_path = dist_dir / f"server{exe_suffix}"
+        if exe_path.exists():
+            shutil.copy2(exe_path, package_dir / f"FedshiIntegrationTool{exe_suffix}")
+            print("✅ Copied executable to package")
+        else:
+            print("❌ Executable not found after build")
+            sys.exit(1)
+    
+    # One directory scan answers every existence check below
+    with os.scandir(".") as it:
+        existing = {entry.name: entry for entry in it}
     
     # Copy static files
     files_to_copy = ["index.html", "app.js", "styles.css", "config.json", "README.md"]
-    for file_name in files_to_copy:
-        if Path(file_name).exists():
-            shutil.copy2(file_name, package_dir)
-            print(f"✅ Copied {file_name}")
+    copied_files = [file_name for file_name in files_to_copy if file_name in existing]
+    copy_jobs = [(Path(file_name), package_dir / file_name) for file_name in copied_files]
     
     # Copy lib directory
-    if Path("lib").exists():
-        shutil.copytree("lib", package_dir / "lib", dirs_exist_ok=True)
+    has_lib = "lib" in existing and existing["lib"].is_dir()
+    if has_lib:
+        for root, _, files in os.walk("lib"):
+            for file_name in files:
+                src = Path(root) / file_name
+                copy_jobs.append((src, package_dir / src))
+    
+    copy_files(copy_jobs)
+    for file_name in copied_files:
+        print(f"✅ Copied {file_name}")
+    if has_lib:
         print("✅ Copied lib directory")
     
     # Create Windows launcher script
@@ -100,14 +167,15 @@ echo ========================================
 echo.
 echo Starting the server...
 echo.
+cd /d "%~dp0"
 FedshiIntegrationTool.exe
 echo.
 echo Press any key to exit...
 pause > nul
 '''
+    # cmd.exe needs CRLF line endings regardless of the build host
     windows_launcher_file = package_dir / "run.bat"
-    with open(windows_launcher_file, 'w') as f:
-        f.write(windows_launcher_content)
+    windows_launcher_file.write_bytes(windows_launcher_content.replace("\n", "\r\n").encode("ascii"))
     print("✅ Created Windows launcher script (run.bat)")
     
     # Create Linux/Mac launcher script
@@ -118,19 +186,20 @@ echo "========================================"
 echo
 echo "Starting the server..."
 echo
+cd "$(dirname "$0")"
 ./FedshiIntegrationTool
 echo
 echo "Press Enter to exit..."
 read
 '''
+    # bash needs LF line endings, even when building on Windows
     linux_launcher_file = package_dir / "run.sh"
-    with open(linux_launcher_file, 'w') as f:
-        f.write(linux_launcher_content)
+    linux_launcher_file.write_bytes(linux_launcher_content.encode("ascii"))
     os.chmod(linux_launcher_file, 0o755)
     print("✅ Created Linux/Mac launcher script (run.sh)")
     
     # Create ZIP archive
-    shutil.make_archive("FedshiIntegrationTool", 'zip', package_dir)
+    create_zip(package_dir, "FedshiIntegrationTool.zip")
     print("✅ Created FedshiIntegrationTool.zip")
     
     print("=" * 60)
@@ -4,64 +4,162 @@ Simple HTTP Server for Sandoog Integration Tool
 
 This script provides a local development server with CORS headers
 to run the Sandoog Integration Tool in a web browser.
+
+When aiohttp is installed the files are served from a single asyncio
+event loop; otherwise the standard library's threading server is used.
 """
 
+import errno
 import http.server
-import socketserver
 import os
+import socket
 import sys
+import time
 from urllib.parse import urlparse
 
+try:
+    from aiohttp import web
+    from aiohttp.abc import AbstractAccessLogger
+except ImportError:
+    web = None
+
+CORS_HEADERS = {
+    'Access-Control-Allow-Origin': '*',
+    'Access-Control-Allow-Methods': 'GET, POST, PUT, DELETE, OPTIONS',
+    'Access-Control-Allow-Headers': 'Content-Type, Authorization, X-API-Key, X-API-Signature, X-API-Timestamp',
+    'Access-Control-Max-Age': '86400',
+}
+
 class CORSHTTPRequestHandler(http.server.SimpleHTTPRequestHandler):
     """HTTP request handler with CORS headers"""
     
+    # Keep connections alive between requests for the page's assets
+    protocol_version = "HTTP/1.1"
+    
+    # CORS header lines, encoded once instead of per send_header() call
+    _CORS_BLOB = "".join(f"{name}: {value}\r\n" for name, value in CORS_HEADERS.items()).encode('latin-1')
+    
     def end_headers(self):
-        # Add CORS headers
-        self.send_header('Access-Control-Allow-Origin', '*')
-        self.send_header('Access-Control-Allow-Methods', 'GET, POST, PUT, DELETE, OPTIONS')
-        self.send_header('Access-Control-Allow-Headers', 'Content-Type, Authorization, X-API-Key, X-API-Signature, X-API-Timestamp')
-        self.send_header('Access-Control-Max-Age', '86400')
+        # Add CORS headers (HTTP/0.9 responses have no headers, as in send_header)
+        if self.request_version != 'HTTP/0.9':
+            if not hasattr(self, '_headers_buffer'):
+                self._headers_buffer = []
+            self._headers_buffer.append(self._CORS_BLOB)
         super().end_headers()
     
     def do_OPTIONS(self):
         """Handle preflight OPTIONS requests"""
         self.send_response(200)
+        self.send_header('Content-Length', '0')
         self.end_headers()
     
     def log_message(self, format, *args):
         """Custom logging to show requests"""
         print(f"[{self.log_date_time_string()}] {format % args}")
 
+if web is not None:
+    @web.middleware
+    async def cors_middleware(request, handler):
+        """Add CORS headers to every response and answer preflight requests"""
+        if request.method == 'OPTIONS':
+            response = web.Response(status=200)
+        else:
+            try:
+                response = await handler(request)
+            except web.HTTPException as e:
+                e.headers.update(CORS_HEADERS)
+                raise
+        response.headers.update(CORS_HEADERS)
+        return response
+    
+    class CORSAccessLogger(AbstractAccessLogger):
+        """Access logger matching the format of CORSHTTPRequestHandler"""
+        
+        def log(self, request, response, time_taken):
+            date = time.strftime("%d/%b/%Y %H:%M:%S")
+            print(f'[{date}] "{request.method} {request.path_qs} '
+                  f'HTTP/{request.version.major}.{request.version.minor}" {response.status} -')
+    
+    async def serve_index(request):
+        """Serve index.html for the site root, like SimpleHTTPRequestHandler"""
+        return web.FileResponse(os.path.join(os.getcwd(), 'index.html'))
+    
+    def create_app():
+        """Create the aiohttp application serving the current directory"""
+        app = web.Application(middlewares=[cors_middleware])
+        app.router.add_get('/', serve_index)
+        app.router.add_static('/', os.getcwd())
+        return app
+
+class CORSThreadingHTTPServer(http.server.ThreadingHTTPServer):
+    """Threading HTTP server that fails to start if the port is taken"""
+    
+    # On Windows SO_REUSEADDR lets a socket bind a port another socket is
+    # already listening on, so only use it on POSIX (as asyncio does)
+    allow_reuse_address = os.name != 'nt'
+
+def check_port_available(port):
+    """
+    Raise OSError if another process is already listening on the port
+    
+    On POSIX, SO_REUSEADDR lets the probe ignore sockets left in TIME_WAIT
+    by a previous run, so quick restarts are not reported as conflicts. On
+    Windows that flag would let the probe share a busy port, so it asks
+    for exclusive use of the port instead.
+    """
+    with socket.socket(socket.AF_INET, socket.SOCK_STREAM) as sock:
+        if os.name == 'nt':
+            sock.setsockopt(socket.SOL_SOCKET, socket.SO_EXCLUSIVEADDRUSE, 1)
+        else:
+            sock.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
+        sock.bind(("", port))
+
+def print_banner(port):
+    """Print the startup banner"""
+    print("=" * 60)
+    print("🚀 Sandoog Integration Tool - Development Server")
+    print("=" * 60)
+    print(f"📁 Serving files from: {os.getcwd()}")
+    print(f"🌐 Server running at: http://localhost:{port}")
+    print(f"📱 Open your browser and navigate to: http://localhost:{port}")
+    print("=" * 60)
+    print("📋 Features:")
+    print("   ✅ CORS headers enabled for API requests")
+    print("   ✅ Automatic file serving")
+    print("   ✅ Request logging")
+    print("=" * 60)
+    print("🛑 Press Ctrl+C to stop the server")
+    print("=" * 60)
+
 def main():
     """Main function to start the server"""
     port = 8080
     
     # Check if port is already in use
     try:
-        with socketserver.TCPServer(("", port), CORSHTTPRequestHandler) as httpd:
-            print("=" * 60)
-            print("🚀 Sandoog Integration Tool - Development Server")
-            print("=" * 60)
-            print(f"📁 Serving files from: {os.getcwd()}")
-            print(f"🌐 Server running at: http://localhost:{port}")
-            print(f"📱 Open your browser and navigate to: http://localhost:{port}")
-            print("=" * 60)
-            print("📋 Features:")
-            print("   ✅ CORS headers enabled for API requests")
-            print("   ✅ Automatic file serving")
-            print("   ✅ Request logging")
-            print("=" * 60)
-            print("🛑 Press Ctrl+C to stop the server")
-            print("=" * 60)
+        check_port_available(port)
+        
+        if web is not None:
+            print_banner(port)
+            # run_app handles Ctrl+C itself and returns once the loop is closed
+            web.run_app(create_app(), port=port, print=None, access_log_class=CORSAccessLogger)
+            print("\n🛑 Server stopped by user")
+            return
+        
+        # Serve each connection on its own thread so a browser's parallel
+        # keep-alive connections don't block each other
+        with CORSThreadingHTTPServer(("", port), CORSHTTPRequestHandler) as httpd:
+            print_banner(port)
             
             try:
                 httpd.serve_forever()
             except KeyboardInterrupt:
                 print("\n🛑 Server stopped by user")
                 httpd.shutdown()
-                
+    
     except OSError as e:
-        if e.errno == 48:  # Address already in use
+        # Windows reports the WSA error code rather than EADDRINUSE
+        if e.errno in (errno.EADDRINUSE, getattr(errno, 'WSAEADDRINUSE', None)):
             print(f"❌ Port {port} is already in use.")
             print(f"💡 Try using a different port: python server.py {port + 1}")
         else:
@@ -69,4 +167,4 @@ def main():
         sys.exit(1)
 
 if __name__ == "__main__":
-    main() 
\ No newline at end of file
+    main()
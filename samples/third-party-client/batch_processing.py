@@ -6,132 +6,174 @@ This script demonstrates how to process multiple order shipment receipts
 in batch using the Fedshi Third-Party API Client.
 """
 
-import asyncio
+import argparse
+import concurrent.futures
+import importlib.util
 import os
+import sys
 import time
-from typing import List
-from third_party_client import ThirdPartyAPIClient, ThirdPartyAPIClientAsync
+from typing import List, Tuple
 
 
-def batch_process_sync(order_shipment_ids: List[str]):
+def batch_process_sync(order_shipment_ids: List[str], max_workers: int = 8) -> float:
     """
     Process multiple receipts synchronously
+    
+    Requests are blocking, so they are spread over a thread pool; the
+    client's session shares its connection pool between the threads.
+    Returns the batch duration in seconds.
     """
     # Configuration
     API_KEY = os.getenv('API_KEY', 'your_api_key_here')
     MASTER_SECRET = os.getenv('MASTER_SECRET', 'your_master_secret_here')
     BASE_URL = os.getenv('BASE_URL', 'https://api.loveyourself.co.uk')
     
+    # Imported here so each mode only loads the HTTP stack it uses
+    from third_party_client import ThirdPartyAPIClient
+    
     client = ThirdPartyAPIClient(API_KEY, MASTER_SECRET, BASE_URL)
     
-    print(f"🔄 Processing {len(order_shipment_ids)} receipts synchronously...")
+    print(f"🔄 Processing {len(order_shipment_ids)} receipts synchronously ({max_workers} threads)...")
     start_time = time.time()
     
-    successful = 0
-    failed = 0
-    
-    for i, shipment_id in enumerate(order_shipment_ids, 1):
-        try:
-            print(f"📄 Processing {i}/{len(order_shipment_ids)}: {shipment_id}")
-            
-            receipt = client.export_order_shipment_receipt(shipment_id)
-            
-            if receipt.get('success'):
-                filename = f"receipt_{shipment_id}.pdf"
-                client.save_receipt_to_file(receipt, filename)
-                print(f"✅ Success: {shipment_id} -> {filename}")
-                successful += 1
-            else:
-                print(f"❌ Failed: {shipment_id} - {receipt.get('error', 'Unknown error')}")
-                failed += 1
-                
-        except Exception as e:
-            print(f"❌ Error processing {shipment_id}: {e}")
-            failed += 1
+    with concurrent.futures.ThreadPoolExecutor(max_workers=max_workers) as executor:
+        results = list(executor.map(
+            lambda shipment_id: process_single_receipt_sync(client, shipment_id),
+            order_shipment_ids
+        ))
     
     end_time = time.time()
     duration = end_time - start_time
     
+    # Count results
+    successful = sum(1 for success, _ in results if success)
+    failed = len(results) - successful
+    
+    print_results(results)
     print(f"\n📊 Batch Processing Complete!")
     print(f"⏱️  Duration: {duration:.2f} seconds")
     print(f"✅ Successful: {successful}")
     print(f"❌ Failed: {failed}")
     print(f"📈 Average time per receipt: {duration/len(order_shipment_ids):.2f} seconds")
+    
+    return duration
+
+
+def process_single_receipt_sync(client, shipment_id: str) -> Tuple[bool, str]:
+    """
+    Process a single receipt synchronously
+    
+    Returns (success, status line); the caller prints all status lines
+    at once when the batch is done.
+    """
+    try:
+        filename = f"receipt_{shipment_id}.pdf"
+        receipt = client.export_order_shipment_receipt(shipment_id, stream_to=filename)
+        
+        if receipt.get('success'):
+            return True, f"✅ Success: {shipment_id} -> {filename}"
+        else:
+            return False, f"❌ Failed: {shipment_id} - {receipt.get('error', 'Unknown error')}"
+            
+    except Exception as e:
+        return False, f"❌ Error processing {shipment_id}: {e}"
+
+
+def print_results(results: List[Tuple[bool, str]]):
+    """
+    Print the per-receipt status lines with a single write
+    """
+    if results:
+        sys.stdout.write("\n".join(line for _, line in results) + "\n")
+        sys.stdout.flush()
 
 
-async def batch_process_async(order_shipment_ids: List[str]):
+async def batch_process_async(order_shipment_ids: List[str], concurrency: int = 8) -> float:
     """
     Process multiple receipts asynchronously (much faster!)
+    
+    At most `concurrency` requests are in flight at once, which keeps the
+    API from being flooded; the client enforces the limit itself.
+    Returns the batch duration in seconds.
     """
     # Configuration
     API_KEY = os.getenv('API_KEY', 'your_api_key_here')
     MASTER_SECRET = os.getenv('MASTER_SECRET', 'your_master_secret_here')
     BASE_URL = os.getenv('BASE_URL', 'https://api.loveyourself.co.uk')
     
-    client = ThirdPartyAPIClientAsync(API_KEY, MASTER_SECRET, BASE_URL)
+    import asyncio
+    from third_party_client import ThirdPartyAPIClientAsync
     
-    print(f"🔄 Processing {len(order_shipment_ids)} receipts asynchronously...")
-    start_time = time.time()
+    client = ThirdPartyAPIClientAsync(API_KEY, MASTER_SECRET, BASE_URL, max_concurrency=concurrency)
     
-    # Create tasks for all receipts
-    tasks = []
-    for shipment_id in order_shipment_ids:
-        task = process_single_receipt_async(client, shipment_id)
-        tasks.append(task)
+    print(f"🔄 Processing {len(order_shipment_ids)} receipts asynchronously (up to {concurrency} at a time)...")
+    start_time = time.time()
     
-    # Execute all tasks concurrently
-    results = await asyncio.gather(*tasks, return_exceptions=True)
+    # Share one connection pool across all receipts
+    async with client:
+        # Create tasks for all receipts
+        tasks = []
+        for shipment_id in order_shipment_ids:
+            task = process_single_receipt_async(client, shipment_id)
+            tasks.append(task)
+        
+        # Execute tasks concurrently, bounded by the client's request limit
+        results = await asyncio.gather(*tasks)
     
     end_time = time.time()
     duration = end_time - start_time
     
     # Count results
-    successful = sum(1 for result in results if result is True)
+    successful = sum(1 for success, _ in results if success)
     failed = len(results) - successful
     
+    print_results(results)
     print(f"\n📊 Async Batch Processing Complete!")
     print(f"⏱️  Duration: {duration:.2f} seconds")
     print(f"✅ Successful: {successful}")
     print(f"❌ Failed: {failed}")
     print(f"📈 Average time per receipt: {duration/len(order_shipment_ids):.2f} seconds")
     
-    # Show speed improvement
-    sync_estimate = len(order_shipment_ids) * 2  # Assume 2 seconds per request
-    speedup = sync_estimate / duration if duration > 0 else 0
-    print(f"🚀 Speed improvement: ~{speedup:.1f}x faster than sequential processing")
+    return duration
 
 
-async def process_single_receipt_async(client, shipment_id: str) -> bool:
+async def process_single_receipt_async(client, shipment_id: str) -> Tuple[bool, str]:
     """
     Process a single receipt asynchronously
+    
+    Returns (success, status line) like process_single_receipt_sync.
     """
     try:
-        receipt = await client.export_order_shipment_receipt(shipment_id)
+        # The client decodes the PDF straight to disk on a worker thread
+        filename = f"receipt_{shipment_id}.pdf"
+        receipt = await client.export_order_shipment_receipt(shipment_id, stream_to=filename)
         
         if receipt.get('success'):
-            # Save the receipt (synchronous operation)
-            filename = f"receipt_{shipment_id}.pdf"
-            
-            # Decode and save
-            import base64
-            content = receipt['data']['content']
-            pdf_content = base64.b64decode(content)
-            
-            with open(filename, 'wb') as f:
-                f.write(pdf_content)
-            
-            print(f"✅ {shipment_id} -> {filename}")
-            return True
+            return True, f"✅ {shipment_id} -> {filename}"
         else:
-            print(f"❌ {shipment_id} - {receipt.get('error', 'Unknown error')}")
-            return False
+            return False, f"❌ {shipment_id} - {receipt.get('error', 'Unknown error')}"
             
     except Exception as e:
-        print(f"❌ Error processing {shipment_id}: {e}")
-        return False
+        return False, f"❌ Error processing {shipment_id}: {e}"
 
 
 def main():
+    parser = argparse.ArgumentParser(description="Export order shipment receipts in batch")
+    parser.add_argument(
+        "--compare",
+        action="store_true",
+        help="also run the sync batch after the async one and report the speedup"
+    )
+    parser.add_argument(
+        "--concurrency",
+        type=int,
+        default=8,
+        help="maximum number of receipts processed at once (default: 8)"
+    )
+    args = parser.parse_args()
+    if args.concurrency < 1:
+        parser.error("--concurrency must be at least 1")
+    
     # Example order shipment IDs (replace with actual FIDs)
     order_shipment_ids = [
         'ABC123',
@@ -147,19 +189,23 @@ def main():
     print("🚀 Fedshi Third-Party API Batch Processing Example")
     print("=" * 50)
     
-    # Check if aiohttp is available for async processing
-    try:
-        import aiohttp
-        print("\n1️⃣ Running ASYNC batch processing (recommended)...")
-        asyncio.run(batch_process_async(order_shipment_ids))
-        
+    # Both clients need httpx with HTTP/2 support; check for it without
+    # importing it
+    if not all(importlib.util.find_spec(name) is not None for name in ('httpx', 'h2')):
+        print("⚠️  httpx not installed. Install with: pip install 'httpx[http2]'")
+        sys.exit(1)
+    
+    import asyncio
+    
+    print("\n1️⃣ Running ASYNC batch processing (recommended)...")
+    async_duration = asyncio.run(batch_process_async(order_shipment_ids, concurrency=args.concurrency))
+    
+    if args.compare:
         print("\n2️⃣ Running SYNC batch processing for comparison...")
-        batch_process_sync(order_shipment_ids)
+        sync_duration = batch_process_sync(order_shipment_ids, max_workers=args.concurrency)
         
-    except ImportError:
-        print("⚠️  aiohttp not installed. Install with: pip install aiohttp")
-        print("📦 Running SYNC batch processing only...")
-        batch_process_sync(order_shipment_ids)
+        speedup = sync_duration / async_duration if async_duration > 0 else 0
+        print(f"🚀 Async was {speedup:.1f}x as fast as the sync batch")
 
 
 if __name__ == "__main__":
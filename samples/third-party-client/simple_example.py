@@ -6,8 +6,6 @@ This script demonstrates basic usage of the API client to export
 order shipment receipts.
 """
 
-from third_party_client import ThirdPartyAPIClient
-import base64
 import os
 
 
@@ -22,6 +20,8 @@ def main():
     
     # Initialize the client
     print("Initializing API client...")
+    from third_party_client import ThirdPartyAPIClient
+    
     client = ThirdPartyAPIClient(
         api_key=API_KEY,
         master_secret=MASTER_SECRET,
@@ -45,7 +45,7 @@ def main():
             print(f"📄 File extension: {extension}")
             print(f"📊 Content size: {len(content)} characters")
             
-            # Save to file
+            # Save to file; the PDF is decoded into it chunk by chunk
             filename = f"receipt_{ORDER_SHIPMENT_ID}.{extension}"
             client.save_receipt_to_file(receipt, filename)
             print(f"💾 Receipt saved as: {filename}")
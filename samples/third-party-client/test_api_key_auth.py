@@ -3,21 +3,83 @@
 Test script for API key authentication
 """
 
-import hashlib
+import functools
 import hmac
 import json
-import requests
-from datetime import datetime
+import os
+import sys
+import httpx
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from time import gmtime, strftime
+from typing import Optional
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# Shared client so every test request reuses pooled connections; HTTPS
+# servers that offer HTTP/2 get all concurrent requests multiplexed
+SESSION = httpx.Client(
+    http2=True,
+    limits=httpx.Limits(max_keepalive_connections=8, max_connections=16),
+    timeout=30
+)
+
+# Constant headers for the test requests; only the signing headers and
+# Referer change per request
+BASE_HEADERS = {
+    'Content-Type': 'application/json',
+    'sec-ch-ua-platform': '"Linux"',
+    'User-Agent': 'Mozilla/5.0 (X11; Linux x86_64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/137.0.0.0 Safari/537.36',
+    'accept': 'application/json, multipart/mixed',
+    'sec-ch-ua': '"Google Chrome";v="137", "Chromium";v="137", "Not/A)Brand";v="24"',
+    'sec-ch-ua-mobile': '?0',
+}
+
+@dataclass(frozen=True)
+class AuthTestRequest:
+    """One request sent by the test script"""
+    base_url: str
+    name: str
+    method: str
+    path: str
+    body: bytes
+    headers: tuple = ()  # (name, value) pairs added to the request headers
+    use_jwt: Optional[bool] = None  # True sends the web JWT, False expects an auth error
+
+def json_dumps(obj):
+    """Serialize to UTF-8 JSON bytes, using orjson when it is installed"""
+    if orjson is not None:
+        return orjson.dumps(obj)
+    return json.dumps(obj).encode('utf-8')
+
+def json_loads(data):
+    """Parse JSON bytes, using orjson when it is installed"""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+def signing_prefix(method, path, body):
+    """Return the timestamp-independent start of the string to sign (all bytes)"""
+    return b"\n".join((method, path, body, b""))
+
+@functools.lru_cache(maxsize=64)
+def sign_with_prefix(prefix, api_key, master_secret, timestamp):
+    """
+    Generate HMAC-SHA256 signature from a precomputed signing prefix
+    
+    All arguments are bytes. Memoized: tests with the same method, path and
+    body signed with the same timestamp share one HMAC computation.
+    """
+    string_to_sign = prefix + b"\n".join((timestamp, api_key))
+    # One-shot HMAC runs entirely in OpenSSL when the digest is given by name
+    return hmac.digest(master_secret, string_to_sign, 'sha256').hex()
 
 def generate_signature(method, path, body, api_key, master_secret, timestamp):
-    """Generate HMAC-SHA256 signature"""
-    string_to_sign = f"{method}\n{path}\n{body}\n{timestamp}\n{api_key}"
-    signature = hmac.new(
-        master_secret.encode('utf-8'),
-        string_to_sign.encode('utf-8'),
-        hashlib.sha256
-    ).hexdigest()
-    return signature
+    """Generate HMAC-SHA256 signature (all arguments are bytes)"""
+    return sign_with_prefix(signing_prefix(method, path, body), api_key, master_secret, timestamp)
 
 def demonstrate_token_usage(login_token):
     """Demonstrate how to use the JWT token obtained from third-party login"""
@@ -29,7 +91,6 @@ def demonstrate_token_usage(login_token):
     API_KEY = "YOUR_API_AKY"  # Replace with actual API key from database
     
     # Get the secret key from environment variable
-    import os
     API_KEY_SECRET = os.getenv('API_KEY_SECRET', "your_api_key_secret_here")
     
     if API_KEY_SECRET == "your_api_key_secret_here":
@@ -38,12 +99,12 @@ def demonstrate_token_usage(login_token):
         return
     
     # Example: Use the token to make a GraphQL query
-    test_query = {
-        "base_url": "http://127.0.0.1:6001",
-        "name": "Admin API - Using Login Token for GraphQL Query",
-        "method": "POST",
-        "path": "/graphql/third-party",
-        "body": json.dumps({
+    test_query = AuthTestRequest(
+        base_url="http://127.0.0.1:6001",
+        name="Admin API - Using Login Token for GraphQL Query",
+        method="POST",
+        path="/graphql/third-party",
+        body=json_dumps({
             "query": """
             query {
               Users(Request: {
@@ -60,50 +121,102 @@ def demonstrate_token_usage(login_token):
             }
             """
         }),
-        "headers": {
-            "Authorization": f"Bearer {login_token}"
-        }
-    }
+        headers=(
+            ("Authorization", f"Bearer {login_token}"),
+        )
+    )
     
     # Generate timestamp and signature for API key auth
-    timestamp = datetime.utcnow().isoformat() + 'Z'
+    timestamp = strftime('%Y-%m-%dT%H:%M:%SZ', gmtime())
     signature = generate_signature(
-        test_query['method'],
-        test_query['path'],
-        test_query['body'],
-        API_KEY,
-        API_KEY_SECRET, # Use the individual secret key
-        timestamp
+        test_query.method.encode('utf-8'),
+        test_query.path.encode('utf-8'),
+        test_query.body,
+        API_KEY.encode('utf-8'),
+        API_KEY_SECRET.encode('utf-8'), # Use the individual secret key
+        timestamp.encode('utf-8')
     )
     
+    # Send it like any other test request; the Authorization header comes
+    # from the query's custom headers
+    lines, _ = run_test(test_query, signature, timestamp, API_KEY, None)
+    print("\n".join(lines))
+
+def run_test(test, signature, timestamp, api_key, jwt_token):
+    """
+    Send one pre-signed test request
+    
+    Returns the lines to print for the test and the login token, if the
+    test was a successful login.
+    """
+    lines = []
+    login_token = None
+    
+    lines.append(f"\n🔍 Testing: {test.name}")
+    lines.append(f"URL: {test.base_url}{test.path}")
+    lines.append(f"Body: {test.body.decode('utf-8')}")
+    
+    lines.append(api_key)
+    lines.append(signature)
+    lines.append(timestamp)
+    # Prepare headers
     headers = {
-        'Content-Type': 'application/json',
-        'X-API-Key': API_KEY,
+        **BASE_HEADERS,
+        'Referer': f"{test.base_url}/",
+        'X-API-Key': api_key,
         'X-API-Signature': signature,
         'X-API-Timestamp': timestamp,
-        'Authorization': f'Bearer {login_token}'
     }
     
+    # Add JWT token for JWT required endpoints
+    if test.use_jwt:
+        headers['authorization'] = f'Bearer {jwt_token}'
+        lines.append("🔐 Using JWT token for authentication")
+    elif test.use_jwt is False:
+        lines.append("🚫 No JWT token - should fail with auth error")
+    
+    # Add custom headers if specified
+    if test.headers:
+        headers.update(test.headers)
+        lines.append(f"🔧 Added custom headers: {[name for name, _ in test.headers]}")
+    
+    # Make request
     try:
-        url = f"{test_query['base_url']}{test_query['path']}"
-        print(f"Making authenticated request to: {url}")
+        url = f"{test.base_url}{test.path}"
+        lines.append(f"Making request to: {url}")
         
-        response = requests.post(
+        response = SESSION.request(
+            test.method,
             url,
             headers=headers,
-            data=test_query['body']
+            content=test.body  # empty for GET, so no body is sent
         )
         
-        print(f"Status Code: {response.status_code}")
+        lines.append(f"Status Code: {response.status_code}")
+        lines.append(f"Response: {response.content[:500].decode('utf-8', errors='replace')}...")  # First 500 bytes
+        
         if response.status_code == 200:
-            print("✅ SUCCESS! Token is working correctly")
-            print(f"Response: {response.text[:200]}...")
+            lines.append("✅ SUCCESS!")
+            
+            # If this is a login request and it's successful, extract the token for demonstration
+            if "admin/login" in test.path and response.status_code == 200:
+                try:
+                    response_data = json_loads(response.content)
+                    if 'data' in response_data and 'Token' in response_data['data']:
+                        login_token = response_data['data']['Token']
+                        lines.append(f"🔑 Login successful! Token obtained: {login_token[:20]}...")
+                        lines.append("💡 You can now use this token for subsequent API calls with Authorization: Bearer <token>")
+                except:
+                    pass
         else:
-            print("❌ FAILED! Token might be invalid or expired")
-            print(f"Response: {response.text}")
+            lines.append("❌ FAILED!")
+            if test.use_jwt is False:
+                lines.append("   (Expected failure - JWT authentication required)")
             
     except Exception as e:
-        print(f"❌ Error: {e}")
+        lines.append(f"❌ Error: {e}")
+    
+    return lines, login_token
 
 def test_api_key_auth():
     # Configuration - Replace with your actual values
@@ -115,43 +228,43 @@ def test_api_key_auth():
     ADMIN_JWT_TOKEN = "eyJhbGdvIjoiSFMyNTYiLCJ0eXBlIjoiSldUIn0=.eyJleHAiOiIxNzUzODc5NjkwIiwiaWF0IjoiMTc1Mzc5MzI5MCIsImp0aSI6IkFDQ0VTUzo2MTozODU3MDJiMy0yZjlhLTQyYTEtOTIxNC1lMGQyMDAwNWE4ZDgiLCJzdWIiOiI2MSJ9._4TaJbE0FQ5erL5ybBTpCP99aY6K63APAC1sWZ1p97g="
 
     # Test endpoints
-    test_endpoints = [
-        {
-            "base_url": "http://127.0.0.1:6001",
-            "name": "Admin API - Third Party Login (Success)",
-            "method": "POST",
-            "path": "/api/v1/third-party/admin/login",
-            "body": json.dumps({
+    test_endpoints = (
+        AuthTestRequest(
+            base_url="http://127.0.0.1:6001",
+            name="Admin API - Third Party Login (Success)",
+            method="POST",
+            path="/api/v1/third-party/admin/login",
+            body=json_dumps({
                 "Email": "saman.shahroudi@ice.global",
                 "Password": "Saman%1991"
             })
-        },
-        {
-            "base_url": "http://127.0.0.1:6001",
-            "name": "Admin API - Third Party Login (Invalid Credentials)",
-            "method": "POST",
-            "path": "/api/v1/third-party/admin/login",
-            "body": json.dumps({
+        ),
+        AuthTestRequest(
+            base_url="http://127.0.0.1:6001",
+            name="Admin API - Third Party Login (Invalid Credentials)",
+            method="POST",
+            path="/api/v1/third-party/admin/login",
+            body=json_dumps({
                 "Email": "saman.shahroudi@ice.global",
                 "Password": "wrongpassword"
             })
-        },
-        {
-            "base_url": "http://127.0.0.1:6001",
-            "name": "Admin API - Third Party Login (Invalid Email)",
-            "method": "POST",
-            "path": "/api/v1/third-party/admin/login",
-            "body": json.dumps({
+        ),
+        AuthTestRequest(
+            base_url="http://127.0.0.1:6001",
+            name="Admin API - Third Party Login (Invalid Email)",
+            method="POST",
+            path="/api/v1/third-party/admin/login",
+            body=json_dumps({
                 "Email": "nonexistent@example.com",
                 "Password": "adminpassword123"
             })
-        },
-        {
-            "base_url": "http://127.0.0.1:6001",
-            "name": "Admin API - CreateAPIKey with Admin Session",
-            "method": "POST",
-            "path": "/graphql/third-party",
-            "body": json.dumps({
+        ),
+        AuthTestRequest(
+            base_url="http://127.0.0.1:6001",
+            name="Admin API - CreateAPIKey with Admin Session",
+            method="POST",
+            path="/graphql/third-party",
+            body=json_dumps({
                 "query": """
                 mutation {
                   CreateAPIKey(Request: {
@@ -166,16 +279,16 @@ def test_api_key_auth():
                 }
                 """
             }),
-            "headers": {
-                "Authorization": f"Bearer {ADMIN_JWT_TOKEN}"
-            }
-        },
-        {
-            "base_url": "http://127.0.0.1:6001",
-            "name": "Admin API - CreateAPIKey without Admin Session (should fail)",
-            "method": "POST",
-            "path": "/graphql/third-party",
-            "body": json.dumps({
+            headers=(
+                ("Authorization", f"Bearer {ADMIN_JWT_TOKEN}"),
+            )
+        ),
+        AuthTestRequest(
+            base_url="http://127.0.0.1:6001",
+            name="Admin API - CreateAPIKey without Admin Session (should fail)",
+            method="POST",
+            path="/graphql/third-party",
+            body=json_dumps({
                 "query": """
                 mutation {
                   CreateAPIKey(Request: {
@@ -190,20 +303,20 @@ def test_api_key_auth():
                 }
                 """
             })
-        },
-        {
-            "base_url": "http://127.0.0.1:6001",
-            "name": "REST Third Party Endpoint",
-            "method": "GET",
-            "path": "/api/v1/third-party/export-order-shipment-receipt/test123",
-            "body": ""
-        },
-        {
-            "base_url": "http://127.0.0.1:6001",
-            "name": "Admin API - Named Query (GetOrders)",
-            "method": "POST",
-            "path": "/graphql/third-party",
-            "body": json.dumps({
+        ),
+        AuthTestRequest(
+            base_url="http://127.0.0.1:6001",
+            name="REST Third Party Endpoint",
+            method="GET",
+            path="/api/v1/third-party/export-order-shipment-receipt/test123",
+            body=b""
+        ),
+        AuthTestRequest(
+            base_url="http://127.0.0.1:6001",
+            name="Admin API - Named Query (GetOrders)",
+            method="POST",
+            path="/graphql/third-party",
+            body=json_dumps({
                 "query": """
                 query GetOrders {
                   Orders(Request: {
@@ -219,13 +332,13 @@ def test_api_key_auth():
                 }
                 """
             })
-        },
-        {
-            "base_url": "http://127.0.0.1:6001",
-            "name": "Admin API - Anonymous Query (Orders)",
-            "method": "POST",
-            "path": "/graphql/third-party",
-            "body": json.dumps({
+        ),
+        AuthTestRequest(
+            base_url="http://127.0.0.1:6001",
+            name="Admin API - Anonymous Query (Orders)",
+            method="POST",
+            path="/graphql/third-party",
+            body=json_dumps({
                 "query": """
                 {
                   Orders(Request: { Page: 1, PageSize: 10 }) {
@@ -237,16 +350,16 @@ def test_api_key_auth():
                 }
                 """
             }),
-            "headers": {
-                        "Authorization": f"Bearer {ADMIN_JWT_TOKEN}"
-            }
-        },
-        {
-            "base_url": "http://127.0.0.1:6001",
-            "name": "Admin API - No Query Keyword (Orders)",
-            "method": "POST",
-            "path": "/graphql/third-party",
-            "body": json.dumps({
+            headers=(
+                ("Authorization", f"Bearer {ADMIN_JWT_TOKEN}"),
+            )
+        ),
+        AuthTestRequest(
+            base_url="http://127.0.0.1:6001",
+            name="Admin API - No Query Keyword (Orders)",
+            method="POST",
+            path="/graphql/third-party",
+            body=json_dumps({
                 "query": """
                 {
                   Orders(Request: {
@@ -262,13 +375,13 @@ def test_api_key_auth():
                 }
                 """
             })
-        },
-        {
-            "base_url": "http://127.0.0.1:6001",
-            "name": "Admin API - Named Mutation (CreateBlock)",
-            "method": "POST",
-            "path": "/graphql/third-party",
-            "body": json.dumps({
+        ),
+        AuthTestRequest(
+            base_url="http://127.0.0.1:6001",
+            name="Admin API - Named Mutation (CreateBlock)",
+            method="POST",
+            path="/graphql/third-party",
+            body=json_dumps({
                 "query": """
                 mutation CreateBlock {
                   CreateBlock(Request: {
@@ -282,13 +395,13 @@ def test_api_key_auth():
                 }
                 """
             })
-        },
-        {
-            "base_url": "http://127.0.0.1:6001",
-            "name": "Admin API - Anonymous Mutation (CreateBlock)",
-            "method": "POST",
-            "path": "/graphql/third-party",
-            "body": json.dumps({
+        ),
+        AuthTestRequest(
+            base_url="http://127.0.0.1:6001",
+            name="Admin API - Anonymous Mutation (CreateBlock)",
+            method="POST",
+            path="/graphql/third-party",
+            body=json_dumps({
                 "query": """
                 mutation {
                   CreateBlock(Request: {
@@ -302,13 +415,13 @@ def test_api_key_auth():
                 }
                 """
             })
-        },
-        {
-            "base_url": "http://127.0.0.1:6002",
-            "name": "Web API - Named Query (GetHome)",
-            "method": "POST",
-            "path": "/graphql/third-party",
-            "body": json.dumps({
+        ),
+        AuthTestRequest(
+            base_url="http://127.0.0.1:6002",
+            name="Web API - Named Query (GetHome)",
+            method="POST",
+            path="/graphql/third-party",
+            body=json_dumps({
                 "query": """
                 query GetHome {
                   Home(Request: {
@@ -330,13 +443,13 @@ def test_api_key_auth():
                 }
                 """
             })
-        },
-        {
-            "base_url": "http://127.0.0.1:6002",
-            "name": "Web API - Anonymous Query (Home)",
-            "method": "POST",
-            "path": "/graphql/third-party",
-            "body": json.dumps({
+        ),
+        AuthTestRequest(
+            base_url="http://127.0.0.1:6002",
+            name="Web API - Anonymous Query (Home)",
+            method="POST",
+            path="/graphql/third-party",
+            body=json_dumps({
                 "query": """
                 query {
                   Home(Request: {
@@ -358,13 +471,13 @@ def test_api_key_auth():
                 }
                 """
             })
-        },
-        {
-            "base_url": "http://127.0.0.1:6002",
-            "name": "Web API - No Query Keyword (Home)",
-            "method": "POST",
-            "path": "/graphql/third-party",
-            "body": json.dumps({
+        ),
+        AuthTestRequest(
+            base_url="http://127.0.0.1:6002",
+            name="Web API - No Query Keyword (Home)",
+            method="POST",
+            path="/graphql/third-party",
+            body=json_dumps({
                 "query": """
                 {
                   Home(Request: {
@@ -386,13 +499,13 @@ def test_api_key_auth():
                 }
                 """
             })
-        },
-        {
-            "base_url": "http://127.0.0.1:6002",
-            "name": "Web API - User Query with JWT",
-            "method": "POST",
-            "path": "/graphql/third-party",
-            "body": json.dumps({
+        ),
+        AuthTestRequest(
+            base_url="http://127.0.0.1:6002",
+            name="Web API - User Query with JWT",
+            method="POST",
+            path="/graphql/third-party",
+            body=json_dumps({
                 "query": """
                 mutation {
                       CreateAPIKey(Request:{
@@ -407,14 +520,14 @@ def test_api_key_auth():
                     }
                 """
             }),
-            "use_jwt": True
-        },
-        {
-            "base_url": "http://127.0.0.1:6002",
-            "name": "Admin API - Create API Key",
-            "method": "POST",
-            "path": "/graphql/third-party",
-            "body": json.dumps({
+            use_jwt=True
+        ),
+        AuthTestRequest(
+            base_url="http://127.0.0.1:6002",
+            name="Admin API - Create API Key",
+            method="POST",
+            path="/graphql/third-party",
+            body=json_dumps({
                 "query": """
                 mutation CreateAPIKey {
                   CreateAPIKey(Request: {
@@ -433,105 +546,62 @@ def test_api_key_auth():
                 }
                 """
             }),
-            "use_jwt": True
-        },
-        {
-            "base_url": "http://127.0.0.1:6001",
-            "name": "Admin API - Create API Key",
-            "method": "POST",
-            "path": "/graphql/third-party",
-            "body": json.dumps({
+            use_jwt=True
+        ),
+        AuthTestRequest(
+            base_url="http://127.0.0.1:6001",
+            name="Admin API - Create API Key",
+            method="POST",
+            path="/graphql/third-party",
+            body=json_dumps({
                 "query": """
                 query GetProductAnalytic($id: FID!) { ProductAnalytic(ProductID: $id) { DeliveryRateInfo { __typename ...ProductAnalyticInfoFragment } RPSInfo { __typename ...ProductAnalyticInfoFragment } } } fragment ProductAnalyticInfoFragment on ProductAnalyticInfo { Value Visible }
                 """
             }),
-            "use_jwt": True
-        }
+            use_jwt=True
+        )
+    )
+    
+    # Only the timestamp changes between signatures, so encode the rest up front
+    prefixes = [
+        signing_prefix(test.method.encode('utf-8'), test.path.encode('utf-8'), test.body)
+        for test in test_endpoints
     ]
     
-    for test in test_endpoints:
-        print(f"\n🔍 Testing: {test['name']}")
-        print(f"URL: {test['base_url']}{test['path']}")
-        print(f"Body: {test['body']}")
-        
-        # Generate timestamp
-        timestamp = datetime.utcnow().isoformat() + 'Z'
-        
-        # Generate signature
-        signature = generate_signature(
-            test['method'],
-            test['path'], 
-            test['body'],
-            API_KEY,
-            API_KEY_SECRET, # Use the individual secret key
-            timestamp
-        )
-
-        print(API_KEY)
-        print(signature)
-        print(timestamp)
-        # Prepare headers
-        headers = {
-            'Content-Type': 'application/json',
-            'sec-ch-ua-platform': '"Linux"',
-            'Referer': f"{test['base_url']}/",
-            'User-Agent': 'Mozilla/5.0 (X11; Linux x86_64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/137.0.0.0 Safari/537.36',
-            'accept': 'application/json, multipart/mixed',
-            'sec-ch-ua': '"Google Chrome";v="137", "Chromium";v="137", "Not/A)Brand";v="24"',
-            'sec-ch-ua-mobile': '?0',
-            'X-API-Key': API_KEY,
-            'X-API-Signature': signature,
-            'X-API-Timestamp': timestamp,
-        }
-        
-        # Add JWT token for JWT required endpoints
-        if test.get('use_jwt', False):
-            headers['authorization'] = f'Bearer {WEB_JWT_TOKEN}'
-            print("🔐 Using JWT token for authentication")
-        elif test.get('use_jwt') is False:
-            print("🚫 No JWT token - should fail with auth error")
-        
-        # Add custom headers if specified
-        if 'headers' in test:
-            headers.update(test['headers'])
-            print(f"🔧 Added custom headers: {list(test['headers'].keys())}")
-        
-        # Make request
-        try:
-            url = f"{test['base_url']}{test['path']}"
-            print(f"Making request to: {url}")
-            
-            response = requests.request(
-                test['method'],
-                url,
-                headers=headers,
-                data=test['body'] if test['method'] == 'POST' else None
-            )
-            
-            print(f"Status Code: {response.status_code}")
-            print(f"Response: {response.text[:500]}...")  # First 500 chars
-            
-            if response.status_code == 200:
-                print("✅ SUCCESS!")
-                
-                # If this is a login request and it's successful, extract the token for demonstration
-                if "admin/login" in test['path'] and response.status_code == 200:
-                    try:
-                        response_data = response.json()
-                        if 'data' in response_data and 'Token' in response_data['data']:
-                            login_token = response_data['data']['Token']
-                            print(f"🔑 Login successful! Token obtained: {login_token[:20]}...")
-                            print("💡 You can now use this token for subsequent API calls with Authorization: Bearer <token>")
-                            demonstrate_token_usage(login_token) # Call the new function
-                    except:
-                        pass
-            else:
-                print("❌ FAILED!")
-                if test.get('use_jwt') is False:
-                    print("   (Expected failure - JWT authentication required)")
-                
-        except Exception as e:
-            print(f"❌ Error: {e}")
+    # One timestamp for the whole run, so identical requests reuse their signature
+    timestamp = strftime('%Y-%m-%dT%H:%M:%SZ', gmtime())
+    
+    # Sign every request before sending any, so the pool only does I/O;
+    # the credentials and timestamp are encoded once for all signatures
+    api_key_bytes = API_KEY.encode('utf-8')
+    secret_bytes = API_KEY_SECRET.encode('utf-8') # Use the individual secret key
+    timestamp_bytes = timestamp.encode('utf-8')
+    signatures = [
+        sign_with_prefix(prefix, api_key_bytes, secret_bytes, timestamp_bytes)
+        for prefix in prefixes
+    ]
+    
+    # Requests are independent, so run them concurrently; each test returns
+    # its output lines, which are printed in order once all are done
+    with ThreadPoolExecutor(max_workers=8) as executor:
+        results = list(executor.map(
+            lambda args: run_test(*args, timestamp, API_KEY, WEB_JWT_TOKEN),
+            zip(test_endpoints, signatures)
+        ))
+    
+    # Write the whole report at once instead of one print() per line
+    output = []
+    login_tokens = []
+    for lines, login_token in results:
+        output.extend(lines)
+        if login_token:
+            login_tokens.append(login_token)
+    sys.stdout.write("\n".join(output) + "\n")
+    sys.stdout.flush()
+    
+    # Run the token demo after the pool so its output doesn't interleave
+    for login_token in login_tokens:
+        demonstrate_token_usage(login_token)
 
 if __name__ == "__main__":
     print("🚀 Testing API Key Authentication with Different GraphQL Formats")
@@ -5,13 +5,122 @@ This SDK provides easy access to the Fedshi third-party API endpoints
 using API key authentication with HMAC signature verification.
 """
 
+import asyncio
+import base64
 import hashlib
 import hmac
 import json
+import os
+import re
+import socket
 import time
-from datetime import datetime
-from typing import Dict, Optional, Any
-import requests
+import warnings
+from typing import Dict, Optional, Any, Tuple
+import httpx
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+try:
+    import _hashlib
+except ImportError:
+    _hashlib = None
+
+# Signing keys hmac with hashlib.sha256; only the OpenSSL implementation
+# runs HMAC in C (using the CPU's SHA extensions where available)
+if _hashlib is None or hashlib.sha256 is not getattr(_hashlib, 'openssl_sha256', None):
+    warnings.warn(
+        "hashlib.sha256 is not provided by OpenSSL; request signing falls back to a slower HMAC",
+        RuntimeWarning
+    )
+
+
+# Send each small signed request as soon as it is written instead of
+# letting Nagle's algorithm hold it back waiting for an ACK
+SOCKET_OPTIONS = [(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)]
+
+# Receipt endpoint; the order shipment ID is appended
+RECEIPT_PATH_PREFIX = "/api/v1/third-party/export-order-shipment-receipt/"
+
+# Base64 characters read per write
+BASE64_CHUNK_SIZE = 64 * 1024
+
+# Characters b64decode would discard, such as MIME line breaks
+NON_BASE64_CHARS = re.compile(r'[^A-Za-z0-9+/=]')
+
+
+def json_dumps(obj: Any) -> bytes:
+    """
+    Serialize an object to compact UTF-8 JSON bytes
+    
+    Uses orjson when it is installed, otherwise the standard library.
+    """
+    if orjson is not None:
+        return orjson.dumps(obj)
+    return json.dumps(obj, separators=(',', ':')).encode('utf-8')
+
+
+def json_loads(data: bytes) -> Any:
+    """Parse JSON bytes, using orjson when it is installed"""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def _string_to_sign(method: str, path: str, body: bytes, timestamp: str, api_key: bytes) -> bytes:
+    """
+    Build the string to sign for a request
+    
+    The fields are joined by newlines: method + path + body + timestamp +
+    api_key. body and api_key are already bytes.
+    """
+    return b"\n".join((method.encode('utf-8'), path.encode('utf-8'), body, timestamp.encode('utf-8'), api_key))
+
+
+def _receipt_content(receipt_data: Dict[str, Any]) -> str:
+    """Return the base64 PDF content of a receipt response, or raise ValueError"""
+    if 'data' not in receipt_data or 'content' not in receipt_data['data']:
+        raise ValueError("Invalid receipt data format")
+    return receipt_data['data']['content']
+
+
+def write_base64_to_file(content: str, filename: str) -> None:
+    """
+    Decode base64 content into a file chunk by chunk
+    
+    Only one chunk of decoded bytes is held in memory at a time instead of
+    the whole decoded document. Line breaks and other non-base64 characters
+    are skipped, as base64.b64decode does. The file is only created if all
+    of the content decodes.
+    
+    Args:
+        content (str): Base64 data, as returned by the API
+        filename (str): Output filename
+    """
+    # Decode into a side file and only move it into place once all the
+    # content has decoded, so invalid data leaves no partial file behind
+    partial_filename = filename + '.part'
+    leftover = ''
+    try:
+        with open(partial_filename, 'wb') as f:
+            for start in range(0, len(content), BASE64_CHUNK_SIZE):
+                chunk = leftover + NON_BASE64_CHARS.sub('', content[start:start + BASE64_CHUNK_SIZE])
+                # Decode whole 4-character groups; the rest joins the next chunk
+                usable = len(chunk) - len(chunk) % 4
+                f.write(base64.b64decode(chunk[:usable]))
+                leftover = chunk[usable:]
+            if leftover:
+                # Incomplete final group: raises binascii.Error like b64decode would
+                f.write(base64.b64decode(leftover))
+        os.replace(partial_filename, filename)
+    except BaseException:
+        try:
+            os.remove(partial_filename)
+        except OSError:
+            pass
+        raise
 
 
 class ThirdPartyAPIClient:
@@ -32,31 +141,59 @@ class ThirdPartyAPIClient:
             base_url (str): Base URL of the API (default: production)
         """
         self.api_key = api_key
+        self._api_key_bytes = api_key.encode('utf-8')  # Last line of every string to sign
         self.master_secret = master_secret.encode('utf-8')  # Convert to bytes for HMAC
         self.base_url = base_url.rstrip('/')
-        self.session = requests.Session()
+        self._receipt_url_prefix = self.base_url + RECEIPT_PATH_PREFIX
+        # Headers that are the same on every request; copied per request
+        self._base_headers = {'X-API-Key': self.api_key, 'Content-Type': 'application/json'}
+        # Keyed once; each signature copies it instead of re-deriving the key pads
+        self._hmac_template = hmac.new(self.master_secret, digestmod=hashlib.sha256)
+        
+        # Pooled HTTP/2 session; requests from several threads sharing the
+        # client are multiplexed over one connection when the server allows it
+        self.session = httpx.Client(
+            transport=httpx.HTTPTransport(
+                http2=True,
+                limits=httpx.Limits(max_connections=100, max_keepalive_connections=20),
+                socket_options=SOCKET_OPTIONS
+            ),
+            timeout=30.0
+        )
+    
+    def __enter__(self):
+        return self
+    
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+    
+    def close(self) -> None:
+        """Close the underlying HTTP session and its pooled connections"""
+        self.session.close()
     
-    def generate_signature(self, method: str, path: str, body: str, timestamp: str) -> str:
+    def generate_signature(self, method: str, path: str, body: bytes, timestamp: str) -> str:
         """
         Generate HMAC signature for request authentication
         
         Args:
             method (str): HTTP method (GET, POST, etc.)
             path (str): API endpoint path
-            body (str): Request body (empty for GET requests)
+            body (bytes): Request body exactly as sent (empty for GET requests)
             timestamp (str): RFC3339 timestamp
             
         Returns:
             str: Hex-encoded HMAC signature
         """
         # Create string to sign: method + path + body + timestamp + api_key
-        string_to_sign = f"{method}\n{path}\n{body}\n{timestamp}\n{self.api_key}"
+        string_to_sign = _string_to_sign(method, path, body, timestamp, self._api_key_bytes)
         
         # Create HMAC signature using SHA256 with master secret
-        hmac_obj = hmac.new(self.master_secret, string_to_sign.encode('utf-8'), hashlib.sha256)
+        hmac_obj = self._hmac_template.copy()
+        hmac_obj.update(string_to_sign)
         return hmac_obj.hexdigest()
     
-    def make_request(self, method: str, path: str, body: Optional[Dict] = None) -> Dict[str, Any]:
+    def make_request(self, method: str, path: str, body: Optional[Dict] = None,
+                     url: Optional[str] = None) -> Dict[str, Any]:
         """
         Make an authenticated request to the API
         
@@ -64,73 +201,85 @@ class ThirdPartyAPIClient:
             method (str): HTTP method
             path (str): API endpoint path
             body (Dict, optional): Request body
+            url (str, optional): Full URL of the path, if already built
             
         Returns:
             Dict: API response
             
         Raises:
-            requests.RequestException: If the request fails
+            httpx.HTTPStatusError: If the API answers with an error status
+            httpx.HTTPError: If the request fails
             ValueError: If the response contains an error
         """
         # Generate timestamp
-        timestamp = datetime.utcnow().isoformat() + 'Z'
+        timestamp = time.strftime('%Y-%m-%dT%H:%M:%SZ', time.gmtime())
         
-        # Prepare body
-        body_string = json.dumps(body) if body else ''
+        # Prepare body; the compact bytes are both signed and sent
+        body_bytes = json_dumps(body) if body else b''
         
         # Generate signature
-        signature = self.generate_signature(method, path, body_string, timestamp)
+        signature = self.generate_signature(method, path, body_bytes, timestamp)
         
         # Prepare headers
-        headers = {
-            'X-API-Key': self.api_key,
-            'X-API-Signature': signature,
-            'X-API-Timestamp': timestamp,
-            'Content-Type': 'application/json'
-        }
+        headers = self._base_headers.copy()
+        headers['X-API-Signature'] = signature
+        headers['X-API-Timestamp'] = timestamp
         
         # Make request
-        url = f"{self.base_url}{path}"
+        if url is None:
+            url = f"{self.base_url}{path}"
         
         try:
             response = self.session.request(
                 method=method,
                 url=url,
                 headers=headers,
-                data=body_string if body_string else None,
-                timeout=30
+                content=body_bytes or None
             )
             
             # Check for HTTP errors
             response.raise_for_status()
             
             # Parse JSON response
-            return response.json()
+            return json_loads(response.content)
             
-        except requests.exceptions.RequestException as e:
-            # Try to extract error message from response
-            error_msg = "Unknown error"
-            if hasattr(e, 'response') and e.response is not None:
-                try:
-                    error_data = e.response.json()
-                    error_msg = error_data.get('error', error_msg)
-                except (ValueError, KeyError):
-                    error_msg = e.response.text or error_msg
+        except httpx.HTTPStatusError as e:
+            # Prefer the API's error message; fall back to the raw body
+            try:
+                error_msg = json_loads(e.response.content).get('error', 'Unknown error')
+            except (ValueError, AttributeError):
+                error_msg = e.response.text or 'Unknown error'
             
-            raise requests.RequestException(f"API request failed: {e} - {error_msg}")
+            raise httpx.HTTPStatusError(
+                f"API request failed: {e} - {error_msg}",
+                request=e.request,
+                response=e.response
+            ) from e
     
-    def export_order_shipment_receipt(self, order_shipment_id: str) -> Dict[str, Any]:
+    def export_order_shipment_receipt(self, order_shipment_id: str, stream_to: Optional[str] = None) -> Dict[str, Any]:
         """
         Export order shipment receipt as PDF
         
         Args:
             order_shipment_id (str): The FID of the order shipment
+            stream_to (str, optional): Save the PDF to this file. The JSON
+                response is still parsed in full, base64 content included;
+                only the decoded PDF is written in chunks instead of being
+                held in memory whole. The base64 content is then dropped
+                from the returned data, and the file is only written if
+                the response reports success.
             
         Returns:
             Dict: Response containing base64 PDF data
         """
-        path = f"/api/v1/third-party/export-order-shipment-receipt/{order_shipment_id}"
-        return self.make_request('GET', path)
+        path = RECEIPT_PATH_PREFIX + order_shipment_id
+        receipt = self.make_request('GET', path, url=self._receipt_url_prefix + order_shipment_id)
+        
+        if stream_to is not None and receipt.get('success'):
+            write_base64_to_file(_receipt_content(receipt), stream_to)
+            del receipt['data']['content']
+        
+        return receipt
     
     def get_usage_stats(self) -> Dict[str, Any]:
         """
@@ -150,17 +299,8 @@ class ThirdPartyAPIClient:
             receipt_data (Dict): Response from export_order_shipment_receipt
             filename (str): Output filename
         """
-        import base64
-        
-        if 'data' not in receipt_data or 'content' not in receipt_data['data']:
-            raise ValueError("Invalid receipt data format")
-        
-        # Decode base64 content
-        pdf_content = base64.b64decode(receipt_data['data']['content'])
-        
-        # Write to file
-        with open(filename, 'wb') as f:
-            f.write(pdf_content)
+        # Decode base64 content into the file a chunk at a time
+        write_base64_to_file(_receipt_content(receipt_data), filename)
         
         print(f"PDF saved as {filename}")
 
@@ -169,10 +309,21 @@ class ThirdPartyAPIClientAsync:
     """
     Async version of the Third-Party API Client
     
-    Uses aiohttp for asynchronous HTTP requests
+    Uses httpx over HTTP/2 for asynchronous HTTP requests, so concurrent
+    calls are multiplexed over a single connection. Clients with the same
+    base URL share one HTTP session, which is closed when the last of them
+    is closed. Use it as an async context manager (or call close()) so the
+    HTTP session is released.
     """
     
-    def __init__(self, api_key: str, master_secret: str, base_url: str = "https://your-domain.com"):
+    # HTTP sessions shared by all clients of a base URL within one event
+    # loop (httpx sessions can't move between loops), and how many open
+    # clients use each of them
+    _shared_sessions: Dict[Tuple[asyncio.AbstractEventLoop, str], httpx.AsyncClient] = {}
+    _session_users: Dict[Tuple[asyncio.AbstractEventLoop, str], int] = {}
+    
+    def __init__(self, api_key: str, master_secret: str, base_url: str = "https://your-domain.com",
+                 max_concurrency: int = 16):
         """
         Initialize the async client with API credentials
         
@@ -180,18 +331,131 @@ class ThirdPartyAPIClientAsync:
             api_key (str): The API key provided by Fedshi
             master_secret (str): The master secret for signature generation
             base_url (str): Base URL of the API (default: production)
+            max_concurrency (int): Maximum number of requests in flight at once
         """
         self.api_key = api_key
+        self._api_key_bytes = api_key.encode('utf-8')
         self.master_secret = master_secret.encode('utf-8')
         self.base_url = base_url.rstrip('/')
+        self._receipt_url_prefix = self.base_url + RECEIPT_PATH_PREFIX
+        self._base_headers = {'X-API-Key': self.api_key, 'Content-Type': 'application/json'}
+        self._hmac_template = hmac.new(self.master_secret, digestmod=hashlib.sha256)
+        self.max_concurrency = max_concurrency
+        self._session = None
+        self._session_key = None
+        # Caps in-flight requests so large gathers queue here instead of
+        # opening connections beyond the pool limit; like the session it is
+        # tied to one event loop, so _get_session() creates it per loop
+        self._semaphore = None
+        self._semaphore_loop = None
+    
+    async def __aenter__(self):
+        self._get_session()
+        return self
+    
+    async def __aexit__(self, exc_type, exc_value, traceback):
+        await self.close()
+    
+    def _get_session(self):
+        """
+        Return the shared HTTP session, creating it on first use
+        
+        All requests made by clients of the same base URL in the running
+        event loop reuse the session's connections. Against an HTTP/2 server
+        they share a single TLS connection; the connection limit only
+        matters if the server falls back to HTTP/1.1, and is sized for
+        several clients sharing the session. Idle connections are kept for
+        75 seconds (httpx defaults to 5) so batches spaced a little apart
+        still skip the TLS handshake.
+        """
+        loop = asyncio.get_running_loop()
+        if self._session is not None and self._session_key[0] is not loop:
+            # Opened under an earlier event loop; it can't be used (or
+            # closed) from this one
+            self._release_session()
+        if self._semaphore_loop is not loop:
+            self._semaphore = asyncio.Semaphore(self.max_concurrency)
+            self._semaphore_loop = loop
+        
+        if self._session is None or self._session.is_closed:
+            # Forget sessions of event loops that have since been closed
+            for stale_key in [key for key in self._shared_sessions if key[0].is_closed()]:
+                del self._shared_sessions[stale_key]
+                del self._session_users[stale_key]
+            
+            key = (loop, self.base_url)
+            session = self._shared_sessions.get(key)
+            if session is None or session.is_closed:
+                session = httpx.AsyncClient(
+                    transport=httpx.AsyncHTTPTransport(
+                        http2=True,
+                        limits=httpx.Limits(max_connections=32, max_keepalive_connections=32, keepalive_expiry=75),
+                        socket_options=SOCKET_OPTIONS
+                    ),
+                    timeout=30
+                )
+                self._shared_sessions[key] = session
+                self._session_users[key] = 0
+            self._session_users[key] += 1
+            self._session = session
+            self._session_key = key
+        return self._session
+    
+    def _release_session(self) -> Optional[httpx.AsyncClient]:
+        """
+        Drop this client's use of its shared HTTP session
+        
+        Returns:
+            httpx.AsyncClient: The session, removed from the pool, if this
+                client was its last user and it still needs closing
+        """
+        session, key = self._session, self._session_key
+        self._session = self._session_key = None
+        # Nothing to do if never opened, or if shutdown_pool() already closed it
+        if session is None or self._shared_sessions.get(key) is not session:
+            return None
+        
+        self._session_users[key] -= 1
+        if self._session_users[key] > 0:
+            return None
+        del self._shared_sessions[key]
+        del self._session_users[key]
+        return session
     
-    def generate_signature(self, method: str, path: str, body: str, timestamp: str) -> str:
+    async def close(self) -> None:
+        """Release the HTTP session, closing it if no other client uses it"""
+        if self._session is not None and self._session_key[0] is not asyncio.get_running_loop():
+            # Its event loop is gone or elsewhere; just let go of it
+            self._release_session()
+            return
+        
+        session = self._release_session()
+        if session is not None:
+            await session.aclose()
+    
+    @classmethod
+    async def shutdown_pool(cls) -> None:
+        """Close every shared HTTP session of the running event loop, e.g. at program exit"""
+        loop = asyncio.get_running_loop()
+        sessions = []
+        for key in list(cls._shared_sessions):
+            if key[0] is loop or key[0].is_closed():
+                session = cls._shared_sessions.pop(key)
+                del cls._session_users[key]
+                if key[0] is loop:
+                    sessions.append(session)
+        for session in sessions:
+            await session.aclose()
+    
+    def generate_signature(self, method: str, path: str, body: bytes, timestamp: str) -> str:
         """Generate HMAC signature (same as sync version)"""
-        string_to_sign = f"{method}\n{path}\n{body}\n{timestamp}\n{self.api_key}"
-        hmac_obj = hmac.new(self.master_secret, string_to_sign.encode('utf-8'), hashlib.sha256)
+        string_to_sign = _string_to_sign(method, path, body, timestamp, self._api_key_bytes)
+        hmac_obj = self._hmac_template.copy()
+        hmac_obj.update(string_to_sign)
         return hmac_obj.hexdigest()
     
-    async def make_request(self, method: str, path: str, body: Optional[Dict] = None) -> Dict[str, Any]:
+    async def make_request(self, method: str, path: str, body: Optional[Dict] = None,
+                           url: Optional[str] = None) -> Dict[str, Any]:
         """
         Make an authenticated async request to the API
         
@@ -199,45 +463,59 @@ class ThirdPartyAPIClientAsync:
             method (str): HTTP method
             path (str): API endpoint path
             body (Dict, optional): Request body
+            url (str, optional): Full URL of the path, if already built
             
         Returns:
             Dict: API response
         """
-        import aiohttp
-        
-        # Generate timestamp and signature
-        timestamp = datetime.utcnow().isoformat() + 'Z'
-        body_string = json.dumps(body) if body else ''
-        signature = self.generate_signature(method, path, body_string, timestamp)
-        
-        # Prepare headers
-        headers = {
-            'X-API-Key': self.api_key,
-            'X-API-Signature': signature,
-            'X-API-Timestamp': timestamp,
-            'Content-Type': 'application/json'
-        }
-        
-        url = f"{self.base_url}{path}"
+        session = self._get_session()
         
-        async with aiohttp.ClientSession() as session:
-            async with session.request(
+        # Sign inside the limit so queued requests don't carry stale timestamps
+        async with self._semaphore:
+            timestamp = time.strftime('%Y-%m-%dT%H:%M:%SZ', time.gmtime())
+            body_bytes = json_dumps(body) if body else b''
+            signature = self.generate_signature(method, path, body_bytes, timestamp)
+            
+            # Prepare headers
+            headers = self._base_headers.copy()
+            headers['X-API-Signature'] = signature
+            headers['X-API-Timestamp'] = timestamp
+            
+            if url is None:
+                url = f"{self.base_url}{path}"
+            
+            response = await session.request(
                 method=method,
                 url=url,
                 headers=headers,
-                data=body_string if body_string else None
-            ) as response:
-                if response.status >= 400:
-                    error_data = await response.json()
-                    error_msg = error_data.get('error', 'Unknown error')
-                    raise aiohttp.ClientError(f"API request failed: {response.status} - {error_msg}")
-                
-                return await response.json()
-    
-    async def export_order_shipment_receipt(self, order_shipment_id: str) -> Dict[str, Any]:
+                content=body_bytes or None
+            )
+        
+        if response.status_code >= 400:
+            # Same fallback as the sync client for non-JSON error bodies
+            try:
+                error_msg = json_loads(response.content).get('error', 'Unknown error')
+            except (ValueError, AttributeError):
+                error_msg = response.text or 'Unknown error'
+            raise httpx.HTTPStatusError(
+                f"API request failed: {response.status_code} - {error_msg}",
+                request=response.request,
+                response=response
+            )
+        
+        return json_loads(response.content)
+    
+    async def export_order_shipment_receipt(self, order_shipment_id: str, stream_to: Optional[str] = None) -> Dict[str, Any]:
         """Async version of export_order_shipment_receipt"""
-        path = f"/api/v1/third-party/export-order-shipment-receipt/{order_shipment_id}"
-        return await self.make_request('GET', path)
+        path = RECEIPT_PATH_PREFIX + order_shipment_id
+        receipt = await self.make_request('GET', path, url=self._receipt_url_prefix + order_shipment_id)
+        
+        if stream_to is not None and receipt.get('success'):
+            # Decode and write on a worker thread to keep the event loop free
+            await asyncio.to_thread(write_base64_to_file, _receipt_content(receipt), stream_to)
+            del receipt['data']['content']
+        
+        return receipt
 
 
 def example_sync():
@@ -245,7 +523,7 @@ def example_sync():
     # Initialize client
     client = ThirdPartyAPIClient(
         api_key='your_api_key_here',
-        secret='your_secret_here',
+        master_secret='your_secret_here',
         base_url='https://api.loveyourself.co.uk'
     )
     
@@ -259,55 +537,80 @@ def example_sync():
         # Save the PDF to a file
         client.save_receipt_to_file(receipt, 'shipment_receipt.pdf')
         
-    except requests.RequestException as e:
+    except httpx.HTTPError as e:
         print(f'Error: {e}')
 
 
 async def example_async():
     """Example usage of the asynchronous client"""
-    # Initialize async client
+    # Initialize async client; the block closes its HTTP session on exit
+    async with ThirdPartyAPIClientAsync(
+        api_key='your_api_key_here',
+        master_secret='your_secret_here',
+        base_url='https://api.loveyourself.co.uk'
+    ) as client:
+        try:
+            # Export multiple receipts concurrently over the shared session
+            order_shipment_ids = ['ABC123', 'DEF456', 'GHI789']
+            receipts = await asyncio.gather(*(
+                client.export_order_shipment_receipt(order_shipment_id)
+                for order_shipment_id in order_shipment_ids
+            ))
+            
+            for i, receipt in enumerate(receipts):
+                print(f'Receipt {i+1} generated successfully')
+                print(f'Content length: {len(receipt["data"]["content"])}')
+            
+        except Exception as e:
+            print(f'Error: {e}')
+
+
+def example_reuse_across_event_loops():
+    """Example reusing one async client under two separate asyncio.run() calls"""
     client = ThirdPartyAPIClientAsync(
         api_key='your_api_key_here',
-        secret='your_secret_here',
+        master_secret='your_secret_here',
         base_url='https://api.loveyourself.co.uk'
     )
     
-    try:
-        # Export multiple receipts concurrently
-        import asyncio
-        
-        tasks = [
-            client.export_order_shipment_receipt('ABC123'),
-            client.export_order_shipment_receipt('DEF456'),
-            client.export_order_shipment_receipt('GHI789')
-        ]
-        
-        receipts = await asyncio.gather(*tasks)
-        
-        for i, receipt in enumerate(receipts):
-            print(f'Receipt {i+1} generated successfully')
-            print(f'Content length: {len(receipt["data"]["content"])}')
-        
-    except Exception as e:
-        print(f'Error: {e}')
+    async def export_all():
+        order_shipment_ids = ['ABC123', 'DEF456', 'GHI789']
+        return await asyncio.gather(*(
+            client.export_order_shipment_receipt(order_shipment_id)
+            for order_shipment_id in order_shipment_ids
+        ), return_exceptions=True)
+    
+    async def close():
+        await client.close()
+    
+    # Each run gets its own HTTP session and concurrency limit
+    for run in range(2):
+        results = asyncio.run(export_all())
+        succeeded = sum(not isinstance(result, Exception) for result in results)
+        print(f'Run {run+1}: {succeeded}/{len(results)} receipts generated')
+        for result in results:
+            # Any other error is expected here, but not one about the event loop
+            if isinstance(result, RuntimeError):
+                raise result
+    asyncio.run(close())
 
 
 def example_with_error_handling():
     """Example with comprehensive error handling"""
     client = ThirdPartyAPIClient(
         api_key='your_api_key_here',
-        secret='your_secret_here'
+        master_secret='your_secret_here'
     )
     
     try:
         receipt = client.export_order_shipment_receipt('ABC123')
         client.save_receipt_to_file(receipt, 'receipt.pdf')
         
-    except requests.exceptions.ConnectionError:
+    except httpx.ConnectError:
         print("Connection error: Could not connect to the API server")
-    except requests.exceptions.Timeout:
+    except httpx.TimeoutException:
         print("Timeout error: Request took too long")
-    except requests.exceptions.HTTPError as e:
+    except httpx.HTTPStatusError as e:
         if e.response.status_code == 401:
             print("Authentication error: Invalid API key or signature")
         elif e.response.status_code == 403:
@@ -316,7 +619,7 @@ def example_with_error_handling():
             print("Not found: Order shipment does not exist")
         else:
             print(f"HTTP error: {e.response.status_code}")
-    except requests.RequestException as e:
+    except httpx.HTTPError as e:
         print(f"Request error: {e}")
     except ValueError as e:
         print(f"Data error: {e}")
@@ -328,12 +631,11 @@ if __name__ == "__main__":
     # Run synchronous example
     example_sync()
     
-    # Run async example (if asyncio is available)
-    try:
-        import asyncio
-        asyncio.run(example_async())
-    except ImportError:
-        print("aiohttp not installed. Install with: pip install aiohttp")
+    # Run async example
+    asyncio.run(example_async())
+    
+    # Run example reusing an async client across event loops
+    example_reuse_across_event_loops()
     
     # Run error handling example
     example_with_error_handling() 
\ No newline at end of file